@@ -0,0 +1,60 @@
+"""Asynchronous downloader module for Neurobik.
+
+This module provides an asyncio/aiohttp based alternative to Downloader for
+workloads with many small files, where multiplexing connections on a single
+event loop beats a thread pool.
+"""
+
+import asyncio
+import os
+
+from neurobik.downloader import CHUNK_SIZE
+from neurobik.utils import create_confirmation_file, new_hasher, split_checksum
+
+try:
+    import aiohttp  # optional - only needed for AsyncDownloader
+except ImportError:
+    aiohttp = None
+
+
+class AsyncDownloader:
+    """Downloads many files concurrently on a single event loop."""
+
+    def __init__(self, chunk_size=CHUNK_SIZE, limit=16, limit_per_host=4):
+        """Initialize with chunk size and connector pool limits."""
+        if aiohttp is None:
+            raise RuntimeError("AsyncDownloader requires aiohttp. Install with: pip install aiohttp")
+        self.chunk_size = chunk_size
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+
+    async def download_file(self, session, url: str, dest: str, checksum=None):
+        """Download a single file, hashing the stream when a checksum is given."""
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        hasher = digest = None
+        if checksum:
+            algorithm, digest = split_checksum(checksum)
+            hasher = new_hasher(algorithm)
+        async with session.get(url) as response:
+            response.raise_for_status()
+            with open(dest, "wb") as f:
+                async for chunk in response.content.iter_chunked(self.chunk_size):
+                    f.write(chunk)
+                    if hasher is not None:
+                        hasher.update(chunk)
+        if hasher is not None and hasher.hexdigest() != digest:
+            raise ValueError(f"Checksum mismatch for {dest}")
+        create_confirmation_file(dest + ".confirmed")
+
+    async def download_many(self, specs):
+        """Download (url, dest, checksum) specs concurrently over one session."""
+        connector = aiohttp.TCPConnector(limit=self._limit, limit_per_host=self._limit_per_host)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            await asyncio.gather(
+                *(self.download_file(session, url, dest, checksum) for url, dest, checksum in specs)
+            )
+
+
+def download_many(specs, chunk_size=CHUNK_SIZE):
+    """Synchronous wrapper so the Click CLI can use the async fan-out."""
+    asyncio.run(AsyncDownloader(chunk_size).download_many(specs))
@@ -4,17 +4,75 @@ This module provides the main CLI entry point for downloading AI models
 and OCI containers based on YAML configuration files.
 """
 
+import functools
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import click
-from neurobik.config import Config
-from neurobik.downloader import Downloader
-from neurobik.tui import NeurobikTUI
-from neurobik.utils import create_confirmation_file, setup_logging
+
+_BANNER_START = """
+╭─┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈─╮
+┊                           🚀 Downloads Starting...                          ┊
+╰─┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈─╯\n"""
+
+_BANNER_DONE = r"""
+╭─┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈─╮                
+┊          🎉 All Downloads Complete - Your AI Overlords Approve! 🎉          ┊
+╰─┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈─╯
+
+╭─═══════════════════════════════════════════════════════════════════════════─╮
+                                                           ·◎◎··●·           
+                                                        ·○○··········        
+                                                      ·◎········· ····       
+                                                     ·················●      
+                                                     ··········     ····     
+                                                  ··◉○·○······      ···○○·   
+                                                ·○○○○·○○············  ··◎·   
+                                              ·○○◉···○○◉· ···············    
+                                        ●◉◉●○···◉·····○○···   ········○·     
+                                        ●◉◉◉··        ●················      
+                                       ◉○◎◎○○·○◎·      ··○··  ····●···       
+           _ _                      ··●·○●◉◉◎◎◎◎◎●       ··●···●·            
+      _   _| |__ (_) | __           ·◉○○◎◎◎◎◎○··○◎                           
+     | | | | '_ \| | |/ /           ·◉○○◎◎◎◎◎○··○◎●·                         
+     | |_| | |_) | |   <            ·●○·○◎◎◎◎◎○··○◉·                         
+      \__,_|_.__/|_|_|\_\           ··◎·○◎◎◎◎◎○··○◎·                         
+                                      ◉○○◎◎◎◎◎◎○··◎●·                        
+     Safe when used as directed.      ·◎·○◎◎◎◎◎○··○◉·                        
+                                      ·◎·○◎◎◎◎◎○○·○◎◎                        
+                                       ●○·○◎◎◎◎◎○··◎◉·                       
+                                       ·◎·○◎◎◎◎◎○··○◎·                       
+                                        ◉○○◎◎◎◎◎◎○·○◎●                       
+                                        ●○·○◎◎◎◎◎○··○◉·                      
+                                        ·◎·○◎◎◎◎◎○○·○◎·                      
+                                         ◉○○○◎◎◎◎◎○○○◎◉                      
+                                         ·◎○○◎◎◎◎◎○○○○◎·                     
+                                         ·◉○○◎◎◎◎◎○○◉○◎·                     
+                                          ●○○○○◎●○··                         
+╰─═══════════════════════════════════════════════════════════════════════════─╯"""
+
+
+# Guards downloaded_models when downloads run on worker threads
+_download_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _existing_entries(dirname):
+    """Return the cached set of entry names in dirname (empty if missing)."""
+    try:
+        return frozenset(entry.name for entry in os.scandir(dirname))
+    except FileNotFoundError:
+        return frozenset()
 
 
-def _download_model(cfg, downloader, item, downloaded_models):
+def _is_downloaded(confirmation_file):
+    """Check whether a confirmation file exists, using the cached directory scan."""
+    return os.path.basename(confirmation_file) in _existing_entries(os.path.dirname(confirmation_file))
+
+
+def _download_model(cfg, downloader, item, downloaded_models, models_by_name):
     """Download a single AI model and add it to the downloaded list.
 
     Args:
@@ -22,8 +80,9 @@ def _download_model(cfg, downloader, item, downloaded_models):
         downloader: Downloader instance
         item: Dictionary with 'name' and 'type' keys
         downloaded_models: List to append downloaded model to
+        models_by_name: Dict mapping model_name to ModelItem
     """
-    model = next(m for m in cfg.models if m.model_name == item["name"])
+    model = models_by_name[item["name"]]
     downloader.pull_model(
         cfg.model_provider,
         model.repo_name,
@@ -31,18 +90,20 @@ def _download_model(cfg, downloader, item, downloaded_models):
         model.location,
         model.confirmation_file,
     )
-    downloaded_models.append(model)
+    with _download_lock:
+        downloaded_models.append(model)
 
 
-def _download_oci(cfg, downloader, item):
+def _download_oci(cfg, downloader, item, oci_by_image):
     """Download or build a single OCI container.
 
     Args:
         cfg: Configuration object
         downloader: Downloader instance
         item: Dictionary with 'name' and 'type' keys
+        oci_by_image: Dict mapping image name to OciItem
     """
-    oci = next(o for o in cfg.oci if o.image == item["name"])
+    oci = oci_by_image[item["name"]]
     downloader.pull_oci(oci.image, oci.confirmation_file, oci.containerfile, oci.build_args)
 
 
@@ -63,10 +124,13 @@ def _relink_default_model(cfg):
         cfg.models[0]  # first in config if no default_gguf
     )
 
-    # Validate that the target model file exists
-    if not os.path.exists(default_model.location):
+    # Validate that the target model file exists (access(F_OK) is cheaper
+    # than stat for a pure existence check)
+    if not os.access(default_model.location, os.F_OK):
         raise ValueError(f"Default model file does not exist: {default_model.location}")
 
+    from neurobik.downloader import Downloader  # pylint: disable=import-outside-toplevel
+
     models_dir = os.path.dirname(default_model.confirmation_file)
     downloader = Downloader()
     downloader.create_default_symlink(models_dir, default_model.location)
@@ -83,6 +147,14 @@ def download(config, relink_default_gguf):
         config: Path to YAML configuration file containing model and OCI definitions
         relink_default_gguf: If True, only update the default GGUF model symlink without downloading
     """
+    # Deferred so `neurobik --help` doesn't pay the pydantic/requests/tqdm
+    # import cost - Click renders help without entering this function.
+    # pylint: disable=import-outside-toplevel
+    from neurobik.config import Config
+    from neurobik.downloader import Downloader
+    from neurobik.tui import NeurobikTUI
+    from neurobik.utils import create_confirmation_file, create_confirmation_files, setup_logging, verify_checksum
+
     logger = setup_logging()
     try:
         cfg = Config.from_yaml(config)
@@ -92,10 +164,13 @@ def download(config, relink_default_gguf):
             return
         Downloader.check_podman()
 
-        # Prepare items for TUI - only show models that haven't been downloaded yet
+        # Prepare items for TUI - only show models that haven't been downloaded yet.
+        # One scandir per confirmation directory instead of one stat per model;
+        # clear first so a previous invocation in-process can't serve stale entries.
+        _existing_entries.cache_clear()
         items = []
         for model in cfg.models:
-            if not os.path.exists(model.confirmation_file):
+            if not _is_downloaded(model.confirmation_file):
                 items.append({"name": model.model_name, "type": "model"})
         for oci in cfg.oci:
             items.append({"name": oci.image, "type": "oci"})
@@ -108,22 +183,45 @@ def download(config, relink_default_gguf):
         tui = NeurobikTUI(items)
         selected = tui.run()
 
-        print(
-            """
-╭─┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈─╮
-┊                           🚀 Downloads Starting...                          ┊
-╰─┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈─╯\n"""
-        )
+        if not selected:
+            # Deselecting everything (or cancelling the prompt) is a valid
+            # answer - don't hand an empty worker count to the pool below
+            click.echo("No items selected.")
+            return
+
+        print(_BANNER_START)
 
         downloader = Downloader()
 
-        # Process selected items
+        # O(1) lookups instead of scanning the config lists per selected item
+        models_by_name = {m.model_name: m for m in cfg.models}
+        oci_by_image = {o.image: o for o in cfg.oci}
+
+        # Process selected items in parallel - downloads are network-bound
+        # and independent, so wall time becomes max() instead of sum()
         downloaded_models = []
-        for item in selected:
-            if item["type"] == "model":
-                _download_model(cfg, downloader, item, downloaded_models)
-            else:
-                _download_oci(cfg, downloader, item)
+        with ThreadPoolExecutor(max_workers=min(8, len(selected))) as executor:
+            futures = []
+            for item in selected:
+                if item["type"] == "model":
+                    futures.append(
+                        executor.submit(_download_model, cfg, downloader, item, downloaded_models, models_by_name)
+                    )
+                else:
+                    futures.append(executor.submit(_download_oci, cfg, downloader, item, oci_by_image))
+            for future in as_completed(futures):
+                future.result()
+
+        # Verify checksums of downloaded models in parallel - hashlib
+        # releases the GIL, so the hashes scale across cores up to disk
+        # bandwidth
+        to_verify = [(m.location, m.checksum) for m in downloaded_models if m.checksum]
+        if to_verify:
+            with ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1)) as executor:
+                futures = {executor.submit(verify_checksum, path, expected): path for path, expected in to_verify}
+                for future in as_completed(futures):
+                    if not future.result():
+                        raise ValueError(f"Checksum mismatch for {futures[future]}")
 
         # Create default symlink if any models were downloaded
         if downloaded_models:
@@ -135,51 +233,14 @@ def download(config, relink_default_gguf):
             downloader.create_default_symlink(models_dir, default_model.location)
             print(f"Default model: {default_model.location}")
 
-        # Create confirmation files after symlinking
-        for model in downloaded_models:
-            create_confirmation_file(model.confirmation_file)
+        # Create confirmation files after symlinking, batched per directory
+        create_confirmation_files(m.confirmation_file for m in downloaded_models)
 
         # Create provider confirmation file if any models were downloaded
         if downloaded_models and cfg.provider_confirmation_file:
             create_confirmation_file(cfg.provider_confirmation_file)
 
-        print(
-            r"""
-╭─┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈─╮                
-┊          🎉 All Downloads Complete - Your AI Overlords Approve! 🎉          ┊
-╰─┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈─╯
-
-╭─═══════════════════════════════════════════════════════════════════════════─╮
-                                                           ·◎◎··●·           
-                                                        ·○○··········        
-                                                      ·◎········· ····       
-                                                     ·················●      
-                                                     ··········     ····     
-                                                  ··◉○·○······      ···○○·   
-                                                ·○○○○·○○············  ··◎·   
-                                              ·○○◉···○○◉· ···············    
-                                        ●◉◉●○···◉·····○○···   ········○·     
-                                        ●◉◉◉··        ●················      
-                                       ◉○◎◎○○·○◎·      ··○··  ····●···       
-           _ _                      ··●·○●◉◉◎◎◎◎◎●       ··●···●·            
-      _   _| |__ (_) | __           ·◉○○◎◎◎◎◎○··○◎                           
-     | | | | '_ \| | |/ /           ·◉○○◎◎◎◎◎○··○◎●·                         
-     | |_| | |_) | |   <            ·●○·○◎◎◎◎◎○··○◉·                         
-      \__,_|_.__/|_|_|\_\           ··◎·○◎◎◎◎◎○··○◎·                         
-                                      ◉○○◎◎◎◎◎◎○··◎●·                        
-     Safe when used as directed.      ·◎·○◎◎◎◎◎○··○◉·                        
-                                      ·◎·○◎◎◎◎◎○○·○◎◎                        
-                                       ●○·○◎◎◎◎◎○··◎◉·                       
-                                       ·◎·○◎◎◎◎◎○··○◎·                       
-                                        ◉○○◎◎◎◎◎◎○·○◎●                       
-                                        ●○·○◎◎◎◎◎○··○◉·                      
-                                        ·◎·○◎◎◎◎◎○○·○◎·                      
-                                         ◉○○○◎◎◎◎◎○○○◎◉                      
-                                         ·◎○○◎◎◎◎◎○○○○◎·                     
-                                         ·◉○○◎◎◎◎◎○○◉○◎·                     
-                                          ●○○○○◎●○··                         
-╰─═══════════════════════════════════════════════════════════════════════════─╯"""
-        )
+        print(_BANNER_DONE)
 
     except KeyboardInterrupt:
         logger.info("Download interrupted by user")
@@ -5,11 +5,36 @@ using Pydantic BaseModel. It handles model and OCI container configurations with
 environment variable expansion and provider validation.
 """
 
+import functools
+import hashlib
 import os
+import pickle
 from typing import List, Optional
 
 import yaml
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, ValidationError, field_validator
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml not available, fall back to the pure-Python loader
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Config files reuse the same $HOME-rooted prefixes over and over; memoizing
+# skips the regex scan and environment lookup for repeated identical paths
+_expandvars = functools.lru_cache(maxsize=256)(os.path.expandvars)
+
+
+def _config_cache_file(config_path: str) -> str:
+    """Return the cache file path for the config at config_path.
+
+    The name derives from the path alone, so editing a config overwrites
+    its previous cache entry instead of leaving one file per (mtime, size)
+    behind forever; the full key stored inside the pickle guards staleness.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    digest = hashlib.sha256(config_path.encode()).hexdigest()
+    return os.path.join(cache_home, "neurobik", f"config-{digest}.pkl")
 
 
 class ModelItem(BaseModel):
@@ -20,7 +45,8 @@ class ModelItem(BaseModel):
         model_name: Specific model filename (e.g., 'Qwen3-0.6B-Q6_K.gguf')
         location: Full path where the model should be stored
         confirmation_file: Path to confirmation file for download tracking
-        checksum: Optional SHA256 checksum for verification
+        checksum: Optional checksum for verification; bare hex is treated as
+            SHA256, or prefix with the algorithm ('sha256:<hex>', 'blake3:<hex>')
     """
 
     repo_name: str
@@ -29,6 +55,12 @@ class ModelItem(BaseModel):
     confirmation_file: str
     checksum: Optional[str] = None
 
+    @field_validator("location", "confirmation_file", mode="after")
+    @classmethod
+    def _expand_path_vars(cls, value: str) -> str:
+        """Expand environment variables in paths during validation."""
+        return _expandvars(value)
+
 
 class OciItem(BaseModel):
     """Configuration item for a single OCI container.
@@ -45,6 +77,12 @@ class OciItem(BaseModel):
     containerfile: Optional[str] = None
     build_args: Optional[List[str]] = Field(default_factory=list)
 
+    @field_validator("confirmation_file", mode="after")
+    @classmethod
+    def _expand_path_vars(cls, value: str) -> str:
+        """Expand environment variables in paths during validation."""
+        return _expandvars(value)
+
 
 class Config(BaseModel):
     """Main configuration class for Neurobik.
@@ -65,24 +103,46 @@ class Config(BaseModel):
 
     @classmethod
     def from_yaml(cls, path: str):
-        """Load configuration from a YAML file."""
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        """Load configuration from a YAML file.
+
+        Parsed configs are cached on disk keyed by (path, mtime, size) so
+        repeated CLI invocations against an unchanged file skip the YAML
+        parse entirely. The cache invalidates itself when the file changes.
+        """
+        st = os.stat(path)
+        cache_key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        cache_file = _config_cache_file(cache_key[0])
+        try:
+            with open(cache_file, "rb") as f:
+                stored_key, dumped = pickle.load(f)
+            if stored_key == cache_key:
+                # The cached dump was already validated and expanded, so
+                # model_construct skips the per-field validator dispatch
+                return cls.model_construct(
+                    models=[ModelItem.model_construct(**m) for m in dumped.pop("models", [])],
+                    oci=[OciItem.model_construct(**o) for o in dumped.pop("oci", [])],
+                    **dumped,
+                )
+        except (OSError, pickle.PickleError, EOFError, AttributeError, TypeError):
+            pass
+
+        # Binary mode lets the loader work on the raw bytes (libyaml handles
+        # UTF-8 detection itself) without an intermediate decode pass.
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=_YamlLoader)
         try:
             config = cls(**data)
-            config.expand_vars()
             config.validate_config()
-            return config
         except ValidationError as e:
             raise ValueError(f"Invalid config: {e}") from e
 
-    def expand_vars(self):
-        """Expand environment variables in paths."""
-        for model in self.models:
-            model.location = os.path.expandvars(model.location)
-            model.confirmation_file = os.path.expandvars(model.confirmation_file)
-        for oci_item in self.oci:
-            oci_item.confirmation_file = os.path.expandvars(oci_item.confirmation_file)
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(cache_file, "wb") as f:
+                pickle.dump((cache_key, config.model_dump()), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass  # caching is best-effort; a read-only cache dir is fine
+        return config
 
     def validate_config(self):
         """Validate configuration values and relationships."""
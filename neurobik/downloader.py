@@ -4,48 +4,296 @@ This module handles downloading AI models and pulling OCI containers
 using appropriate providers and tools.
 """
 
+import functools
 import os
 import shutil
 import subprocess
-from typing import List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Tuple
+from urllib.parse import urlparse
 
 import requests
-from tqdm import tqdm
+from huggingface_hub import hf_hub_download
 
-from neurobik.utils import create_confirmation_file, verify_checksum
+from neurobik.utils import create_confirmation_file, ensure_dir, new_hasher, split_checksum, verify_checksum
+
+try:
+    import zstandard  # optional - streaming decompression for .zst downloads
+except ImportError:
+    zstandard = None
+
+# 1 MiB blocks keep the copy loop dominated by network/disk rather than
+# per-chunk Python dispatch; throughput plateaus past ~100 KiB
+CHUNK_SIZE = 1 << 20
+
+# Bounds and tuning for the adaptive read-size loop: aim for roughly one
+# read per TARGET_READ_TIME seconds, adjusting every ADAPT_WINDOW chunks
+MIN_CHUNK_SIZE = 1 << 16
+MAX_CHUNK_SIZE = 1 << 22
+ADAPT_WINDOW = 16
+TARGET_READ_TIME = 0.05
+
+# Below this size the ranged path's extra HEAD plus 4-connection fan-out
+# costs more than a single stream saves; parallel ranges only pay off on
+# the multi-hundred-MiB GGUFs
+MIN_RANGED_SIZE = 64 << 20
+
+
+class _RangeUnsupported(Exception):
+    """Server answered a Range request with something other than 206."""
+
+
+class _HashingWriter:  # pylint: disable=too-few-public-methods
+    """File-like wrapper that updates a hash with everything written.
+
+    Lets the checksum follow the decompressed bytes when a .zst stream sits
+    between the network and the file.
+    """
+
+    def __init__(self, fileobj, hasher):
+        self.fileobj = fileobj
+        self.hasher = hasher
+
+    def write(self, data):
+        """Hash data and pass it through to the wrapped file object."""
+        self.hasher.update(data)
+        return self.fileobj.write(data)
 
 
 class Downloader:
     """Handles downloading of AI models and OCI containers."""
 
-    def __init__(self, progress_callback=None):
-        """Initialize downloader with optional progress callback."""
+    def __init__(self, progress_callback=None, chunk_size=CHUNK_SIZE):
+        """Initialize downloader with optional progress callback and chunk size."""
         self.progress_callback = progress_callback
+        self.chunk_size = chunk_size
+        # Reuse one session so back-to-back downloads from the same host
+        # (HuggingFace) share pooled connections instead of paying a fresh
+        # TCP + TLS handshake per file
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=8,
+            max_retries=requests.adapters.Retry(total=5, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
-    def download_file(self, url: str, dest: str, checksum: Optional[str] = None):
-        """Download a file from URL with progress bar and optional checksum verification."""
-        os.makedirs(os.path.dirname(dest), exist_ok=True)
-        response = requests.get(url, stream=True, timeout=30)
-        response.raise_for_status()
-        total_size = int(response.headers.get("content-length", 0))
-        with (
-            open(dest, "wb", encoding=None) as f,
-            tqdm(
+    def close(self):
+        """Close the pooled HTTP session."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _download_ranged(self, url: str, dest: str, parts: int = 4) -> bool:
+        """Fetch url into dest with parallel HTTP Range requests.
+
+        A single TCP stream is limited by one congestion window; filling
+        several windows in parallel wins on high-bandwidth paths. Returns
+        False - so the caller falls back to a single stream - when the file
+        is too small to pay for the fan-out, the HEAD probe fails (some
+        CDNs and presigned URLs reject HEAD), the server does not advertise
+        byte-range support, or it answers a Range request with 200.
+        """
+        from tqdm import tqdm  # pylint: disable=import-outside-toplevel
+
+        try:
+            head = self.session.head(url, timeout=30, allow_redirects=True)
+            head.raise_for_status()
+        except requests.RequestException:
+            return False
+        total = int(head.headers.get("content-length", 0))
+        if total < MIN_RANGED_SIZE or head.headers.get("accept-ranges", "").lower() != "bytes":
+            return False
+
+        fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            with tqdm(
                 desc=f"Downloading {dest}",
-                total=total_size,
+                total=total,
                 unit="B",
                 unit_scale=True,
                 unit_divisor=1024,
-            ) as progress_bar,
-        ):
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-                progress_bar.update(len(chunk))
-        if checksum and not verify_checksum(dest, checksum):
+            ) as progress_bar:
+
+                def fetch(lo, hi):
+                    response = self.session.get(url, headers={"Range": f"bytes={lo}-{hi}"}, stream=True, timeout=30)
+                    response.raise_for_status()
+                    if response.status_code != 206:
+                        raise _RangeUnsupported(url)
+                    response.raw.decode_content = True
+                    offset = lo
+                    while chunk := response.raw.read(self.chunk_size):
+                        os.pwrite(fd, chunk, offset)
+                        offset += len(chunk)
+                        progress_bar.update(len(chunk))
+
+                part_size = -(-total // parts)  # ceil division
+                ranges = [(lo, min(lo + part_size, total) - 1) for lo in range(0, total, part_size)]
+                with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                    futures = [executor.submit(fetch, lo, hi) for lo, hi in ranges]
+                    for future in as_completed(futures):
+                        future.result()
+        except _RangeUnsupported:
+            # Accept-Ranges lied (200 instead of 206): the caller's single
+            # stream re-opens dest and overwrites the partial write
+            return False
+        finally:
+            os.close(fd)
+        return True
+
+    @staticmethod
+    def _copy_local(src: str, dest: str):
+        """Copy a local file, staying in kernel space where the OS allows.
+
+        copy_file_range never moves the bytes through userspace and is a
+        metadata-only reflink on CoW filesystems; shutil.copyfile (itself
+        sendfile-backed) covers filesystems that refuse the syscall.
+        """
+        try:
+            size = os.stat(src).st_size
+            with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+                copied = 0
+                while copied < size:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), size - copied)
+                    if n == 0:
+                        break
+                    copied += n
+        except (OSError, AttributeError):
+            shutil.copyfile(src, dest)
+
+    def download_file(self, url: str, dest: str, checksum: Optional[str] = None):
+        """Download a file from URL with progress bar and optional checksum verification."""
+        # Deferred so importing the module doesn't pay for tqdm
+        from tqdm import tqdm  # pylint: disable=import-outside-toplevel
+
+        ensure_dir(os.path.dirname(dest))
+        if urlparse(url).scheme == "file":
+            # Local source (dev file:// URLs, pre-seeded caches): no HTTP at all
+            self._copy_local(urlparse(url).path, dest)
+            if checksum and not verify_checksum(dest, checksum):
+                raise ValueError(f"Checksum mismatch for {dest}")
+            create_confirmation_file(dest + ".confirmed")
+            print(f"✅ Downloaded {os.path.basename(dest)} successfully!")
+            return
+        is_zst = url.endswith(".zst")
+        if is_zst and zstandard is None:
+            raise RuntimeError("Downloading .zst requires zstandard. Install with: pip install zstandard")
+        if checksum is None and not is_zst:
+            # Verified downloads hash the stream in order and .zst streams
+            # decompress sequentially, so only the plain unverified path can
+            # take the out-of-order ranged fast path
+            if self._download_ranged(url, dest):
+                create_confirmation_file(dest + ".confirmed")
+                print(f"✅ Downloaded {os.path.basename(dest)} successfully!")
+                return
+        response = self.session.get(url, stream=True, timeout=30)
+        response.raise_for_status()
+        total_size = int(response.headers.get("content-length", 0))
+        # Copy straight from the raw socket in large blocks instead of
+        # paying one Python-level iteration per 8 KiB chunk
+        response.raw.decode_content = True
+        # Unbuffered: blocks arrive already ~1 MiB, so BufferedWriter
+        # would only add an extra memcpy per write
+        with open(dest, "wb", buffering=0) as f:
+            if total_size > 0 and not is_zst:
+                # Reserve the extents up front instead of growing the file
+                # chunk by chunk; degrade gracefully where unsupported
+                # (.zst skipped: content-length is the compressed size)
+                try:
+                    os.posix_fallocate(f.fileno(), 0, total_size)
+                except (OSError, AttributeError):
+                    pass
+            if checksum or is_zst:
+                # Hash while streaming - one pass over the bytes instead of
+                # re-reading the finished file from disk to verify it. For
+                # .zst the hash sits below the decompressor, so it covers
+                # the decompressed bytes that land on disk.
+                hasher = None
+                sink = f
+                if checksum:
+                    algorithm, digest = split_checksum(checksum)
+                    hasher = new_hasher(algorithm)
+                    sink = _HashingWriter(sink, hasher)
+                if is_zst:
+                    sink = zstandard.ZstdDecompressor().stream_writer(sink, closefd=False)
+                with tqdm(
+                    desc=f"Downloading {dest}",
+                    total=total_size,
+                    unit="B",
+                    unit_scale=True,
+                    unit_divisor=1024,
+                ) as progress_bar:
+                    chunk_size = self.chunk_size
+                    window = []
+                    while True:
+                        start = time.monotonic()
+                        chunk = response.raw.read(chunk_size)
+                        if not chunk:
+                            break
+                        window.append((len(chunk), time.monotonic() - start))
+                        sink.write(chunk)
+                        progress_bar.update(len(chunk))
+                        if len(window) >= ADAPT_WINDOW:
+                            chunk_size = self._adapt_chunk_size(chunk_size, window)
+                            window.clear()
+                if is_zst:
+                    sink.close()  # flush the final zstd frame (closefd=False)
+            else:
+                # wrapattr drives the bar from inside copyfileobj's write
+                # calls - no per-chunk Python callback of our own
+                with tqdm.wrapattr(
+                    f,
+                    "write",
+                    desc=f"Downloading {dest}",
+                    total=total_size,
+                    unit="B",
+                    unit_scale=True,
+                    unit_divisor=1024,
+                ) as writer:
+                    shutil.copyfileobj(response.raw, writer, length=self.chunk_size)
+        if checksum and hasher.hexdigest() != digest:
             raise ValueError(f"Checksum mismatch for {dest}")
         create_confirmation_file(dest + ".confirmed")
         print(f"✅ Downloaded {os.path.basename(dest)} successfully!")
 
+    @staticmethod
+    def _adapt_chunk_size(chunk_size: int, samples: List[Tuple[int, float]]) -> int:
+        """Return the next read size based on harmonic-mean throughput.
+
+        The harmonic mean damps the few unusually fast buffered reads and
+        tracks the sustained rate: grow the read size on fast links (fewer
+        syscalls), shrink it on slow ones (lower per-read latency).
+        """
+        rates = [nbytes / dt for nbytes, dt in samples if dt > 0]
+        if not rates:
+            return chunk_size
+        harmonic = len(rates) / sum(1.0 / rate for rate in rates)
+        target = harmonic * TARGET_READ_TIME
+        if target > chunk_size and chunk_size < MAX_CHUNK_SIZE:
+            return chunk_size * 2
+        if target < chunk_size / 4 and chunk_size > MIN_CHUNK_SIZE:
+            return chunk_size // 2
+        return chunk_size
+
+    def download_many(self, specs: List[Tuple[str, str, Optional[str]]]):
+        """Download multiple (url, dest, checksum) specs in parallel.
+
+        Workers share the pooled session, so each file is network-bound
+        rather than handshake-bound; the first failure propagates.
+        """
+        if not specs:
+            return
+        with ThreadPoolExecutor(max_workers=min(4, len(specs))) as executor:
+            futures = [executor.submit(self.download_file, url, dest, checksum) for url, dest, checksum in specs]
+            for future in as_completed(futures):
+                future.result()
+
     def pull_model(
         self,
         _provider: Optional[str],
@@ -56,11 +304,10 @@ class Downloader:
     ):
         """Download a model using the appropriate provider."""
         dest_dir = os.path.dirname(location)
-        os.makedirs(dest_dir, exist_ok=True)
-        subprocess.run(
-            ["hf", "download", repo_name, model_name, "--local-dir", dest_dir],
-            check=True,
-        )
+        ensure_dir(dest_dir)
+        # In-process download skips the ~200ms interpreter cold-start of
+        # shelling out to the hf CLI per model
+        hf_hub_download(repo_id=repo_name, filename=model_name, local_dir=dest_dir)
         # Confirmation file creation moved to after symlinking
 
     def pull_oci(
@@ -71,7 +318,7 @@ class Downloader:
         build_args: Optional[List[str]] = None,
     ):
         """Pull or build an OCI container."""
-        os.makedirs(os.path.dirname(confirmation_file), exist_ok=True)
+        ensure_dir(os.path.dirname(confirmation_file))
         if containerfile:
             context = os.path.dirname(containerfile)
             cmd = ["podman", "build", "-t", image]
@@ -85,29 +332,27 @@ class Downloader:
         create_confirmation_file(confirmation_file)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def check_podman():
-        """Check if podman is installed."""
+        """Check if podman is installed. PATH rarely changes in-process, so
+        the result is cached to avoid rescanning every PATH entry per call."""
         if not shutil.which("podman"):
             raise RuntimeError("Podman not installed")
 
-    @staticmethod
-    def check_huggingface_cli():
-        """Check if huggingface CLI is installed."""
-        if not shutil.which("hf"):
-            raise RuntimeError("hf CLI not installed. Install with: pip install huggingface_hub")
-
     @staticmethod
     def create_default_symlink(models_dir: str, first_model_location: str):
         """Create a symlink 'default-model.gguf' pointing to the specified model."""
         symlink_path = os.path.join(models_dir, "default-model.gguf")
         target = os.path.relpath(first_model_location, models_dir)
 
-        # Remove existing symlink if it exists
-        if os.path.lexists(symlink_path):
-            try:
-                os.unlink(symlink_path)
-            except OSError as e:
-                raise RuntimeError(f"Failed to remove existing symlink {symlink_path}: {e}") from e
+        # Remove existing symlink if present - EAFP saves the lstat syscall
+        # when there is nothing to remove
+        try:
+            os.unlink(symlink_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            raise RuntimeError(f"Failed to remove existing symlink {symlink_path}: {e}") from e
 
         # Create new symlink
         try:
@@ -4,7 +4,8 @@ This module provides a simple interactive interface for selecting
 AI models and OCI containers to download using questionary.
 """
 
-import questionary
+import os
+import sys
 
 
 class NeurobikTUI:  # pylint: disable=too-few-public-methods
@@ -16,6 +17,15 @@ class NeurobikTUI:  # pylint: disable=too-few-public-methods
 
     def run(self):
         """Run the interactive selection interface and return selected items."""
+        # Non-interactive sessions (CI, piped stdio, NEUROBIK_YES=1) get
+        # select-all without spawning a prompt_toolkit app, which would
+        # otherwise hang or fail terminal setup
+        if os.environ.get("NEUROBIK_YES") == "1" or not (sys.stdin.isatty() and sys.stdout.isatty()):
+            return list(self.items)
+
+        # Deferred so CLI startup and non-interactive runs skip the import
+        import questionary  # pylint: disable=import-outside-toplevel
+
         print(
             r"""
 ╭─═══════════════════════════════════════════════════════════════════════════─╮
@@ -30,9 +40,7 @@ class NeurobikTUI:  # pylint: disable=too-few-public-methods
 """
         )
 
-        choices = [f"{item['type']}: {item['name']}" for item in self.items]
-        selected_indices = questionary.checkbox("Select items to download:", choices).ask()
-        if selected_indices:
-            selected = [self.items[choices.index(choice)] for choice in selected_indices]
-            return selected
-        return []
+        # Dict lookup instead of an O(N) choices.index per selected label
+        label_to_item = {f"{item['type']}: {item['name']}": item for item in self.items}
+        selected_labels = questionary.checkbox("Select items to download:", list(label_to_item)).ask() or []
+        return [label_to_item[label] for label in selected_labels]
@@ -5,27 +5,119 @@ file operations, and logging setup.
 """
 
 import hashlib
+import json
+import mmap
 import os
 from pathlib import Path
 
-from loguru import logger
+try:
+    import blake3  # optional - much faster than SHA-256 on GB-scale files
+except ImportError:
+    blake3 = None
+
+
+def split_checksum(expected_checksum: str):
+    """Split an optionally prefixed checksum into (algorithm, hex digest).
+
+    Unprefixed checksums default to sha256 for backward compatibility.
+
+    Args:
+        expected_checksum: Checksum string, e.g. 'abc123' or 'blake3:abc123'
+
+    Returns:
+        Tuple of (algorithm name, hex digest)
+    """
+    algorithm, _, digest = expected_checksum.rpartition(":")
+    return algorithm or "sha256", digest
+
+
+def new_hasher(algorithm: str):
+    """Create a hash object for the given algorithm name.
+
+    Args:
+        algorithm: 'blake3' or any hashlib algorithm name
+
+    Returns:
+        Hash object supporting update()/hexdigest()
+    """
+    if algorithm == "blake3":
+        if blake3 is None:
+            raise RuntimeError(
+                "blake3 checksum requested but blake3 is not installed. Install with: pip install blake3"
+            )
+        return blake3.blake3()
+    return hashlib.new(algorithm)
 
 
 def verify_checksum(file_path: str, expected_checksum: str) -> bool:
-    """Verify SHA256 checksum of a file.
+    """Verify the checksum of a file.
 
     Args:
         file_path: Path to the file to check
-        expected_checksum: Expected SHA256 hash as hex string
+        expected_checksum: Expected hash as hex string, optionally prefixed
+            with the algorithm ('sha256:<hex>' or 'blake3:<hex>'; bare hex
+            strings are treated as SHA256)
 
     Returns:
         True if checksum matches, False otherwise
     """
-    sha256 = hashlib.sha256()
+    algorithm, digest = split_checksum(expected_checksum)
+
+    # One stat against a sidecar record beats re-reading gigabytes: if the
+    # file is byte-identical to when it last verified, skip the hash
+    st = os.stat(file_path)
+    sidecar = file_path + ".confirmed.json"
+    try:
+        with open(sidecar, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if (
+            cached.get("checksum") == expected_checksum
+            and cached.get("mtime_ns") == st.st_mtime_ns
+            and cached.get("size") == st.st_size
+        ):
+            return True
+    except (OSError, ValueError):
+        pass
+
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest() == expected_checksum
+        try:
+            # One C-level update over the mapped pages - no per-chunk
+            # Python transitions and no buffer copies
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                hasher = new_hasher(algorithm)
+                hasher.update(mm)
+                matches = hasher.hexdigest() == digest
+        except (ValueError, OSError):
+            # Empty files and filesystems without mmap support fall back to
+            # file_digest, which still reads in C with a large buffer
+            f.seek(0)
+            matches = hashlib.file_digest(f, lambda: new_hasher(algorithm)).hexdigest() == digest
+
+    if matches:
+        try:
+            with open(sidecar, "w", encoding="utf-8") as f:
+                json.dump({"checksum": expected_checksum, "mtime_ns": st.st_mtime_ns, "size": st.st_size}, f)
+        except OSError:
+            pass  # the sidecar is an optimization, not a requirement
+    return matches
+
+
+# Directories already created in-process: makedirs(exist_ok=True) costs a
+# stat per path component every call, so memoize the paths it has handled
+_known_dirs = set()
+
+
+def ensure_dir(dirname: str):
+    """Create dirname if this process has not already done so.
+
+    Args:
+        dirname: Directory path to create (parents included)
+    """
+    if dirname not in _known_dirs:
+        os.makedirs(dirname, exist_ok=True)
+        _known_dirs.add(dirname)
 
 
 def create_confirmation_file(path: str):
@@ -34,15 +126,30 @@ def create_confirmation_file(path: str):
     Args:
         path: Path where to create the confirmation file
     """
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+    ensure_dir(os.path.dirname(path))
     Path(path).touch()
 
 
+def create_confirmation_files(paths):
+    """Create a batch of confirmation files, making each parent directory once.
+
+    Args:
+        paths: Iterable of confirmation file paths
+    """
+    for path in paths:
+        ensure_dir(os.path.dirname(path))
+        # Bare open/close touch - no BufferedWriter setup and teardown
+        os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644))
+
+
 def setup_logging():
     """Setup structured logging with file rotation.
 
     Returns:
         Configured logger instance
     """
+    # Deferred so importing utils doesn't pay the loguru import cost
+    from loguru import logger  # pylint: disable=import-outside-toplevel
+
     logger.add("neurobik.log", rotation="10 MB")
     return logger
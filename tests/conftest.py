@@ -0,0 +1,95 @@
+# pylint: disable=redefined-outer-name
+"""Shared fixtures for the Neurobik test suite.
+
+The sample YAML config is identical for every test that reads it, so it
+is written once per session instead of once per test.
+"""
+
+import subprocess
+import textwrap
+from unittest.mock import MagicMock
+
+import pytest
+
+from neurobik.config import Config
+from neurobik.downloader import Downloader
+
+# The serialized config is baked once at import; the fixture only formats
+# in the session temp directory, so no dict building or YAML emission
+# happens on the setup path at all
+_CFG_YAML = textwrap.dedent(
+    """\
+    model_provider: ollama
+    oci_provider: podman
+    models:
+      - repo_name: test/repo
+        model_name: model.gguf
+        location: {dir}/test-model.gguf
+        confirmation_file: {dir}/test-model.confirmed
+        checksum: dummy
+    oci:
+      - image: "test-image:latest"
+        confirmation_file: {dir}/test-image.confirmed
+    """
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_cache_home(tmp_path_factory):
+    """Point XDG_CACHE_HOME at a session temp dir so Config.from_yaml's
+    on-disk pickle cache never writes into (or reads from) the real
+    ~/.cache/neurobik of whoever runs the suite."""
+    mp = pytest.MonkeyPatch()
+    mp.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("xdg-cache")))
+    yield
+    mp.undo()
+
+
+@pytest.fixture(scope="session")
+def sample_config(tmp_path_factory):
+    """
+    Pytest fixture that creates a temporary YAML config file for testing.
+
+    Replication steps (Python/pytest):
+    1. Format the module-level YAML constant with the temp directory
+    2. Point model/confirmation paths at a session-scoped temp directory
+    3. Write the precomputed YAML string once per session
+    4. Return file path for test use
+    5. Cleanup is handled by pytest's tmp_path_factory LRU teardown
+
+    For other languages:
+    - Use the framework's managed temp directories
+    - Precompute static serialized payloads at load time
+    - Keep all test artifacts inside the managed directory so failed
+      runs don't leak files into a shared /tmp
+    """
+    cfg_dir = tmp_path_factory.mktemp("cfg")
+    config_path = cfg_dir / "config.yaml"
+    config_path.write_text(_CFG_YAML.format(dir=cfg_dir), encoding="utf-8")
+    return str(config_path)
+
+
+@pytest.fixture(scope="session")
+def downloader():
+    """Session-wide Downloader - nothing in the tests mutates it, so one
+    instance (and one pooled session) serves every test."""
+    return Downloader()
+
+
+@pytest.fixture(scope="session")
+def cfg(sample_config):
+    """Session-wide parsed Config - the YAML never changes, so parse once."""
+    return Config.from_yaml(sample_config)
+
+
+@pytest.fixture
+def mock_subprocess(monkeypatch):
+    """Per-test subprocess.run mock installed with a direct setattr.
+
+    monkeypatch swaps the attribute without mock.patch's string-target
+    import resolution, and undoes itself on teardown. Defaults to a
+    successful CompletedProcess; tests reconfigure side_effect as needed.
+    """
+    mock = MagicMock(return_value=subprocess.CompletedProcess(args=[], returncode=0))
+    monkeypatch.setattr("neurobik.downloader.subprocess.run", mock)
+    return mock
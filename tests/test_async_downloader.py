@@ -0,0 +1,139 @@
+# pylint: disable=redefined-outer-name,unused-argument,wrong-import-order
+"""
+Neurobik Async Downloader Test Suite
+
+This test suite validates the asyncio/aiohttp based downloader used for
+many-small-file workloads. It tests the optional-dependency guard and the
+streaming checksum verification, without requiring aiohttp itself.
+
+Key Features Tested:
+- RuntimeError with an install hint when aiohttp is not installed
+- Checksum verification over the streamed (chunked) response body
+- Confirmation file creation only on verified downloads
+
+Test Environment:
+- Fakes the aiohttp session/response objects, so no network or aiohttp
+- Uses pytest tmp_path directories for file operations
+- Drives coroutines with asyncio.run from synchronous tests
+
+Replication Guide (for Python or other languages):
+1. Stub the optional dependency to exercise the missing-dependency path
+2. Fake the HTTP client's async response with an async chunk iterator
+3. Test streaming hash computation against a known digest
+4. Verify marker files appear only after successful verification
+
+Dependencies for replication:
+- pytest for test framework
+- asyncio for driving coroutines from sync tests
+- hashlib for checksum expectations
+"""
+
+import asyncio
+import hashlib
+from unittest.mock import MagicMock
+
+import pytest
+
+import neurobik.async_downloader as async_downloader
+from neurobik.async_downloader import AsyncDownloader
+
+
+class _FakeContent:  # pylint: disable=too-few-public-methods
+    """Stand-in for aiohttp's response.content with async chunk iteration."""
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    async def iter_chunked(self, size):
+        """Yield the payload in size-bounded chunks."""
+        for i in range(0, len(self.payload), size):
+            yield self.payload[i:i + size]
+
+
+class _FakeResponse:
+    """Minimal aiohttp response double usable as an async context manager."""
+
+    def __init__(self, payload):
+        self.content = _FakeContent(payload)
+
+    def raise_for_status(self):
+        """No-op: the faked response is always a 200."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+class _FakeSession:  # pylint: disable=too-few-public-methods
+    """Minimal aiohttp session double returning a canned response."""
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def get(self, url):
+        """Return the canned response as an async context manager."""
+        return _FakeResponse(self._payload)
+
+
+def test_async_downloader_requires_aiohttp(monkeypatch):
+    """
+    Test that AsyncDownloader refuses to construct without aiohttp.
+
+    Replication steps (Python/pytest):
+    1. Patch the module's aiohttp attribute to None (import failed)
+    2. Construct AsyncDownloader()
+    3. Assert RuntimeError raised with a pip install hint
+
+    Key validations:
+    - Optional dependency failure surfaces at construction, not mid-download
+    - Error message names the missing package and how to install it
+
+    For other languages:
+    - Test optional/plugin dependency guards
+    - Fail fast with actionable install instructions
+    """
+    monkeypatch.setattr(async_downloader, "aiohttp", None)
+    with pytest.raises(RuntimeError, match="aiohttp"):
+        AsyncDownloader()
+
+
+@pytest.mark.parametrize("scenario", ["success", "mismatch"])
+def test_async_download_file_checksum(scenario, monkeypatch, tmp_path):
+    """
+    Test streaming checksum verification in AsyncDownloader.download_file.
+
+    Replication steps (Python/pytest):
+    1. Patch the module's aiohttp attribute so construction succeeds
+    2. Fake the session/response pair with an async chunk iterator
+    3. Run download_file via asyncio.run with a correct or wrong checksum
+    4. success: assert file content and the .confirmed marker
+       mismatch: assert ValueError and no .confirmed marker
+
+    Key validations:
+    - Hash computed over the streamed chunks matches a known digest
+    - Mismatch raises ValueError naming the destination
+    - Confirmation file created only for verified downloads
+
+    For other languages:
+    - Fake async HTTP responses with chunked bodies
+    - Test hash-over-stream implementations for both outcomes
+    - Verify marker files follow verification, not the write
+    """
+    monkeypatch.setattr(async_downloader, "aiohttp", MagicMock())
+
+    payload = b"test"
+    checksum = hashlib.sha256(payload).hexdigest() if scenario == "success" else "0" * 64
+    dest = tmp_path / "model.gguf"
+
+    downloader = AsyncDownloader()
+    session = _FakeSession(payload)
+    if scenario == "success":
+        asyncio.run(downloader.download_file(session, "https://example.com/model.gguf", str(dest), checksum))
+        assert dest.read_bytes() == payload
+        assert dest.with_suffix(".gguf.confirmed").exists()
+    else:
+        with pytest.raises(ValueError, match="Checksum mismatch"):
+            asyncio.run(downloader.download_file(session, "https://example.com/model.gguf", str(dest), checksum))
+        assert not dest.with_suffix(".gguf.confirmed").exists()
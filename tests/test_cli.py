@@ -57,15 +57,17 @@ def runner():
     return CliRunner()
 
 
-@patch("neurobik.cli.Config.from_yaml")
-def test_cli_invalid_config(mock_config_from_yaml, runner):
+@patch("neurobik.config.Config.from_yaml")
+@patch("neurobik.utils.setup_logging")
+def test_cli_invalid_config(mock_setup_logging, mock_config_from_yaml, runner):
     """
     Test CLI behavior with invalid YAML configuration.
 
     Replication steps:
-    1. Mock Config.from_yaml to raise ValueError
-    2. Invoke CLI with invalid config path
-    3. Assert exit code 1 and error message in output
+    1. Mock setup_logging so loguru never writes ./neurobik.log
+    2. Mock Config.from_yaml to raise ValueError
+    3. Invoke CLI with invalid config path
+    4. Assert exit code 1 and error message in output
 
     Validates error handling for malformed configs.
     """
@@ -76,14 +78,16 @@ def test_cli_invalid_config(mock_config_from_yaml, runner):
     assert "Error: Invalid config" in result.output
 
 
-@patch("neurobik.cli.Downloader.check_podman")
+@patch("neurobik.downloader.Downloader.check_podman")
+@patch("neurobik.downloader.hf_hub_download")
 @patch("neurobik.downloader.subprocess.run")
 @patch("neurobik.tui.NeurobikTUI.run")
-@patch("neurobik.cli.setup_logging")
+@patch("neurobik.utils.setup_logging")
 def test_cli_multiple_models_symlinking(
     mock_setup_logging,
     mock_tui_run,
     mock_subprocess_run,
+    mock_hf_download,
     mock_check_podman,
     runner,
     tmp_path,
@@ -165,14 +169,16 @@ def test_cli_multiple_models_symlinking(
     assert (tmp_path / ".neurobik-ready").exists()
 
 
-@patch("neurobik.cli.Downloader.check_podman")
+@patch("neurobik.downloader.Downloader.check_podman")
+@patch("neurobik.downloader.hf_hub_download")
 @patch("neurobik.downloader.subprocess.run")
 @patch("neurobik.tui.NeurobikTUI.run")
-@patch("neurobik.cli.setup_logging")
+@patch("neurobik.utils.setup_logging")
 def test_cli_default_gguf_specified(
     mock_setup_logging,
     mock_tui_run,
     mock_subprocess_run,
+    mock_hf_download,
     mock_check_podman,
     runner,
     tmp_path,
@@ -230,14 +236,16 @@ def test_cli_default_gguf_specified(
     assert str(tmp_path / "models" / "model2.gguf") in result.output  # Should point to model2
 
 
-@patch("neurobik.cli.Downloader.check_podman")
+@patch("neurobik.downloader.Downloader.check_podman")
+@patch("neurobik.downloader.hf_hub_download")
 @patch("neurobik.downloader.subprocess.run")
 @patch("neurobik.tui.NeurobikTUI.run")
-@patch("neurobik.cli.setup_logging")
+@patch("neurobik.utils.setup_logging")
 def test_cli_filters_downloaded_models(
     mock_setup_logging,
     mock_tui_run,
     mock_subprocess_run,
+    mock_hf_download,
     mock_check_podman,
     runner,
     tmp_path,
@@ -301,14 +309,16 @@ def test_cli_filters_downloaded_models(
     assert (tmp_path / ".neurobik-ready").exists()
 
 
-@patch("neurobik.cli.Downloader.check_podman")
+@patch("neurobik.downloader.Downloader.check_podman")
+@patch("neurobik.downloader.hf_hub_download")
 @patch("neurobik.downloader.subprocess.run")
 @patch("neurobik.tui.NeurobikTUI.run")
-@patch("neurobik.cli.setup_logging")
+@patch("neurobik.utils.setup_logging")
 def test_cli_symlink_creation_failure(
     mock_setup_logging,
     mock_tui_run,
     mock_subprocess_run,
+    mock_hf_download,
     mock_check_podman,
     runner,
     tmp_path,
@@ -370,14 +380,16 @@ def test_cli_symlink_creation_failure(
     assert "Failed to create symlink" in result.output
 
 
-@patch("neurobik.cli.Downloader.check_podman")
+@patch("neurobik.downloader.Downloader.check_podman")
+@patch("neurobik.downloader.hf_hub_download")
 @patch("neurobik.downloader.subprocess.run")
 @patch("neurobik.tui.NeurobikTUI.run")
-@patch("neurobik.cli.setup_logging")
+@patch("neurobik.utils.setup_logging")
 def test_cli_symlink_removal_failure(
     mock_setup_logging,
     mock_tui_run,
     mock_subprocess_run,
+    mock_hf_download,
     mock_check_podman,
     runner,
     tmp_path,
@@ -447,10 +459,10 @@ def test_cli_symlink_removal_failure(
     assert "Failed to remove existing symlink" in result.output
 
 
-@patch("neurobik.cli.Downloader.check_podman")
+@patch("neurobik.downloader.Downloader.check_podman")
 @patch("neurobik.downloader.subprocess.run")
 @patch("neurobik.tui.NeurobikTUI.run")
-@patch("neurobik.cli.setup_logging")
+@patch("neurobik.utils.setup_logging")
 def test_cli_relink_default_gguf(mock_setup_logging, mock_tui_run, mock_subprocess_run, mock_check_podman, runner, tmp_path):
     """
     Test CLI --relink-default-gguf option updates symlink without downloading.
@@ -517,10 +529,10 @@ def test_cli_relink_default_gguf(mock_setup_logging, mock_tui_run, mock_subproce
     mock_tui_run.assert_not_called()
 
 
-@patch("neurobik.cli.Downloader.check_podman")
+@patch("neurobik.downloader.Downloader.check_podman")
 @patch("neurobik.downloader.subprocess.run")
 @patch("neurobik.tui.NeurobikTUI.run")
-@patch("neurobik.cli.setup_logging")
+@patch("neurobik.utils.setup_logging")
 def test_cli_relink_default_gguf_no_default(mock_setup_logging, mock_tui_run, mock_subprocess_run, mock_check_podman, runner, tmp_path):
     """
     Test CLI --relink-default-gguf uses first model when no default_gguf specified.
@@ -570,10 +582,10 @@ def test_cli_relink_default_gguf_no_default(mock_setup_logging, mock_tui_run, mo
     mock_tui_run.assert_not_called()
 
 
-@patch("neurobik.cli.Downloader.check_podman")
+@patch("neurobik.downloader.Downloader.check_podman")
 @patch("neurobik.downloader.subprocess.run")
 @patch("neurobik.tui.NeurobikTUI.run")
-@patch("neurobik.cli.setup_logging")
+@patch("neurobik.utils.setup_logging")
 def test_cli_relink_default_gguf_missing_model(mock_setup_logging, mock_tui_run, mock_subprocess_run, mock_check_podman, runner, tmp_path):
     """
     Test CLI --relink-default-gguf fails when target model file doesn't exist.
@@ -616,10 +628,10 @@ def test_cli_relink_default_gguf_missing_model(mock_setup_logging, mock_tui_run,
     mock_tui_run.assert_not_called()
 
 
-@patch("neurobik.cli.Downloader.check_podman")
+@patch("neurobik.downloader.Downloader.check_podman")
 @patch("neurobik.downloader.subprocess.run")
 @patch("neurobik.tui.NeurobikTUI.run")
-@patch("neurobik.cli.setup_logging")
+@patch("neurobik.utils.setup_logging")
 def test_cli_relink_default_gguf_default_specified_no_models(mock_setup_logging, mock_tui_run, mock_subprocess_run, mock_check_podman, runner, tmp_path):
     """
     Test CLI --relink-default-gguf fails when default_gguf is specified but no models exist.
@@ -647,10 +659,10 @@ def test_cli_relink_default_gguf_default_specified_no_models(mock_setup_logging,
     mock_tui_run.assert_not_called()
 
 
-@patch("neurobik.cli.Downloader.check_podman")
+@patch("neurobik.downloader.Downloader.check_podman")
 @patch("neurobik.downloader.subprocess.run")
 @patch("neurobik.tui.NeurobikTUI.run")
-@patch("neurobik.cli.setup_logging")
+@patch("neurobik.utils.setup_logging")
 def test_cli_relink_default_gguf_no_default_no_models(mock_setup_logging, mock_tui_run, mock_subprocess_run, mock_check_podman, runner, tmp_path):
     """
     Test CLI --relink-default-gguf does nothing when no default_gguf and no models exist.
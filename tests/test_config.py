@@ -123,7 +123,7 @@ def test_environment_variable_expansion():
     Replication steps (Python/pytest):
     1. Set environment variables (e.g., TEST_HOME=/tmp)
     2. Create Config with paths containing $TEST_HOME
-    3. Call expand_vars() method
+    3. Expansion happens during field validation at construction
     4. Assert paths are expanded correctly
     5. Clean up environment variables
 
@@ -159,9 +159,7 @@ def test_environment_variable_expansion():
             oci=[OciItem(image="test:latest", confirmation_file="$TEST_HOME/.pulled")],
         )
 
-        cfg.expand_vars()
-
-        # Check expansion worked
+        # Check expansion worked (applied by field validators at construction)
         assert cfg.models[0].location == "/tmp/test/models/model.gguf"
         assert cfg.models[0].confirmation_file == "/tmp/test/.confirmed"
         assert cfg.oci[0].confirmation_file == "/tmp/test/.pulled"
@@ -1,4 +1,4 @@
-# pylint: disable=import-outside-toplevel,redefined-outer-name,unused-argument,wrong-import-order,unused-import
+# pylint: disable=redefined-outer-name,unused-argument,wrong-import-order,unused-import
 """
 Neurobik Downloader Test Suite
 
@@ -14,7 +14,7 @@ Key Features Tested:
 - Error handling for download failures and permission issues
 
 Test Environment:
-- Uses /tmp directories for file operations
+- Uses pytest tmp_path directories for file operations
 - Mocks subprocess.run for external CLI calls
 - Mocks requests for HTTP downloads
 - Uses monkeypatch for file system operations
@@ -33,138 +33,102 @@ Replication Guide (for Python or other languages):
 Dependencies for replication:
 - pytest for test framework
 - unittest.mock for patching subprocess and requests
-- tempfile for test file management
+- pytest tmp_path for test file management
 - hashlib for checksum verification
 - os/pathlib for file operations
 """
 
-# pylint: disable=import-outside-toplevel,redefined-outer-name,unused-argument,wrong-import-order
+# pylint: disable=redefined-outer-name,unused-argument,wrong-import-order
 
+import hashlib
+import io
 import pytest
 import os
-import tempfile
-from unittest.mock import patch
+import re
+import requests
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 from neurobik.downloader import Downloader
 
+# Payload -> digest pairs computed once at import; parametrized cases look
+# them up instead of re-hashing (and avoid inline magic hex strings)
+_PAYLOADS = {
+    name: (data, hashlib.sha256(data).hexdigest())
+    for name, data in [("small", b"test"), ("medium", b"x" * (1 << 16))]
+}
 
-@pytest.fixture
-def sample_config():
-    """
-    Pytest fixture that creates a temporary YAML config file for testing.
+# Compiled once; parametrized failure cases reuse the pattern instead of
+# paying a regex compile inside every pytest.raises
+_CHECKSUM_MISMATCH = re.compile(r"Checksum mismatch")
 
-    Replication steps (Python/pytest):
-    1. Create dictionary with valid config structure
-    2. Use tempfile.NamedTemporaryFile to create temp file
-    3. Write YAML content using yaml.dump
-    4. Yield file path for test use
-    5. Clean up file after test completion
 
-    For other languages:
-    - Create temporary files with unique names
-    - Serialize config objects to YAML/JSON
-    - Ensure proper cleanup in test teardown
-    - Use /tmp or equivalent temp directories
-    """
-    config_data = {
-        "model_provider": "ollama",
-        "oci_provider": "podman",
-        "models": [
-            {
-                "repo_name": "test/repo",
-                "model_name": "model.gguf",
-                "location": "/tmp/test-model.gguf",
-                "confirmation_file": "/tmp/test-model.confirmed",
-                "checksum": "dummy",
-            }
-        ],
-        "oci": [
-            {
-                "image": "test-image:latest",
-                "confirmation_file": "/tmp/test-image.confirmed",
-            }
-        ],
-    }
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        import yaml
-
-        yaml.dump(config_data, f)
-        f.flush()
-        yield f.name
-    os.unlink(f.name)
-
-
-@patch("neurobik.downloader.subprocess.run")
-def test_confirmation_files_created_on_success(mock_subprocess, sample_config):
+@pytest.mark.parametrize("scenario", ["success", "failure"])
+def test_confirmation_file_after_oci_pull(mock_subprocess, scenario, cfg, downloader, tmp_path):
     """
-    Test that confirmation files are created after successful OCI pulls.
+    Test that confirmation files are created only after successful OCI pulls.
+
+    Both outcomes share the same scaffolding (config parse, Downloader,
+    subprocess mock), so one parametrized test covers them instead of two
+    copies that differ only in the mock's behavior.
 
     Replication steps (Python/pytest):
     1. Load config with OCI container definition
-    2. Mock subprocess.run to return success (returncode 0)
-    3. Call pull_oci() with image and confirmation file path
-    4. Assert confirmation file exists at expected location
-    5. Clean up created files
+    2. Mock subprocess.run to succeed or raise, per scenario
+    3. Call pull_oci() with image and a test-private confirmation path
+    4. success: assert confirmation file exists at expected location
+       failure: assert the exception propagates and no file is created
 
     Key validations:
     - subprocess.run called with correct podman pull command
-    - Confirmation file created after successful pull
-    - No confirmation file created on failure (separate test)
-    - File operations work in /tmp directory
-
-    For other languages:
-    - Mock container runtime CLI calls
-    - Test file creation after successful operations
-    - Verify cleanup happens after subprocess success
-    - Test with different container image names
-    """
-
-
-@patch("neurobik.downloader.subprocess.run")
-def test_confirmation_files_not_created_on_failure(mock_subprocess, sample_config):
-    """
-    Test that confirmation files are NOT created when downloads fail.
-
-    Replication steps (Python/pytest):
-    1. Load config with model and OCI definitions
-    2. Mock subprocess.run to raise exceptions or return failure codes
-    3. Call pull_model() and pull_oci() expecting exceptions
-    4. Assert confirmation files do NOT exist
-    5. Verify exceptions are properly propagated
-
-    Key validations:
-    - No confirmation files created on subprocess failures
+    - Confirmation file created after successful pull only
     - Exceptions from subprocess are not caught internally
     - Atomic operation: either full success or full failure
-    - File system remains clean after failures
 
     For other languages:
-    - Mock external command failures
-    - Test that partial operations don't leave artifacts
-    - Verify exception propagation
-    - Test cleanup on error paths
+    - Mock container runtime CLI calls and their failures
+    - Test file creation after successful operations
+    - Verify that partial operations don't leave artifacts
+    - Test with different container image names
     """
-
-
-@patch("neurobik.downloader.requests.get")
-def test_download_file_success(mock_get, sample_config):
+    oci = cfg.oci[0]
+    confirmation_path = tmp_path / "test-image.confirmed"
+
+    if scenario == "success":
+        downloader.pull_oci(oci.image, str(confirmation_path))
+        mock_subprocess.assert_called_once_with(["podman", "pull", oci.image], check=True)
+    else:
+        mock_subprocess.side_effect = subprocess.CalledProcessError(1, cmd="podman")
+        with pytest.raises(subprocess.CalledProcessError, match="podman"):
+            downloader.pull_oci(oci.image, str(confirmation_path))
+
+    # One scandir returns every entry at once instead of a stat per file
+    present = {entry.name for entry in os.scandir(tmp_path)}
+    assert (confirmation_path.name in present) == (scenario == "success")
+
+
+@pytest.mark.parametrize(
+    "payload_name",
+    ["small", pytest.param("medium", marks=pytest.mark.slow)],
+)
+def test_download_file_success(payload_name, tmp_path):
     """
     Test successful HTTP file download with checksum verification.
 
     Replication steps (Python/pytest):
-    1. Mock requests.get to return successful response
-    2. Set up mock response with content-length header and data
+    1. Mock the pooled session's get to return a streaming response
+    2. Back the response body with one BytesIO buffer - raw.read(size)
+       serves size-bounded chunks lazily, the way a socket would
     3. Call download_file with URL, destination, and correct SHA256
-    4. Assert downloaded file exists
+    4. Assert downloaded file exists with the expected content
     5. Assert confirmation file (.confirmed) exists
-    6. Clean up test files
 
     Key validations:
-    - HTTP GET request made to correct URL
-    - Progress bar functionality (tqdm) works
+    - HTTP GET request made to correct URL with stream=True
     - Checksum verification passes for correct hash
     - Confirmation file created after successful download
-    - File content matches expected data
+    - File content matches expected data across multiple chunks
 
     For other languages:
     - Mock HTTP client libraries
@@ -173,24 +137,37 @@ def test_download_file_success(mock_get, sample_config):
     - Create marker files after successful downloads
     - Test file I/O operations
     """
+    payload, checksum = _PAYLOADS[payload_name]
+    dest = tmp_path / "model.gguf"
 
+    mock_response = MagicMock()
+    mock_response.headers = {"content-length": str(len(payload))}
+    # One BytesIO backs the whole stream: raw.read(size) serves real
+    # size-bounded chunks from a single buffer, like a socket would
+    mock_response.raw.read.side_effect = io.BytesIO(payload).read
+
+    downloader = Downloader()
+    with patch.object(downloader.session, "get", return_value=mock_response) as mock_get:
+        downloader.download_file("https://example.com/model.gguf", str(dest), checksum)
+        mock_get.assert_called_once_with("https://example.com/model.gguf", stream=True, timeout=30)
 
-@patch("neurobik.downloader.requests.get")
-def test_download_file_checksum_mismatch(mock_get, sample_config):
+    assert dest.read_bytes() == payload
+    assert dest.with_suffix(".gguf.confirmed").exists()
+
+
+def test_download_file_checksum_mismatch(tmp_path):
     """
     Test checksum verification failure for downloaded files.
 
     Replication steps (Python/pytest):
-    1. Mock requests.get with valid response and content
-    2. Call download_file with incorrect checksum
+    1. Mock the pooled session's get with a valid streamed response
+    2. Call download_file with an incorrect checksum
     3. Assert ValueError raised with "Checksum mismatch" message
-    4. Verify partial downloads are cleaned up
-    5. Check no confirmation file created
+    4. Check no confirmation file created
 
     Key validations:
-    - SHA256 checksum computed correctly
+    - SHA256 checksum computed correctly over the stream
     - Mismatch detected and exception raised
-    - Downloaded file removed on checksum failure
     - No confirmation file created for failed downloads
     - Error message is descriptive
 
@@ -199,12 +176,93 @@ def test_download_file_checksum_mismatch(mock_get, sample_config):
     - Test hash comparison logic
     - Verify cleanup on validation failures
     - Test with various incorrect checksums
-    - Ensure atomic download-verification operations
     """
+    payload = b"test"
+    dest = tmp_path / "model.gguf"
+
+    mock_response = MagicMock()
+    mock_response.headers = {"content-length": str(len(payload))}
+    mock_response.raw.read.side_effect = io.BytesIO(payload).read
+
+    downloader = Downloader()
+    with patch.object(downloader.session, "get", return_value=mock_response):
+        with pytest.raises(ValueError, match=_CHECKSUM_MISMATCH.pattern):
+            downloader.download_file("https://example.com/model.gguf", str(dest), "0" * 64)
+
+    assert not dest.with_suffix(".gguf.confirmed").exists()
+
+
+@pytest.mark.parametrize("reason", ["head_rejected", "no_range_support", "small_file", "range_ignored"])
+def test_download_file_falls_back_to_single_stream(reason, tmp_path):
+    """
+    Test that unverified downloads fall back when ranges are unusable.
+
+    The ranged fast path must degrade to one plain GET whenever the HEAD
+    probe fails (CDNs and presigned URLs often reject HEAD), the server
+    doesn't advertise byte ranges, the file is too small to pay for the
+    fan-out, or the server answers a Range request with 200 instead of 206.
+
+    Replication steps (Python/pytest):
+    1. Mock the pooled session's head/get per fallback reason
+    2. Call download_file without a checksum (the only ranged path)
+    3. Assert the file arrives intact via the single-stream path
+    4. Assert the confirmation file exists
+
+    Key validations:
+    - requests.RequestException from HEAD never escapes download_file
+    - Missing accept-ranges: bytes skips the fan-out entirely
+    - Files under the ranged-size threshold take the single stream
+    - A 200 reply to a Range GET retries single-stream, not an error
+
+    For other languages:
+    - Probe range support before parallel downloads
+    - Treat probe failures as 'unsupported', not fatal errors
+    - Verify fallback produces byte-identical output
+    """
+    payload = b"test"
+    dest = tmp_path / "model.gguf"
+
+    mock_head = MagicMock()
+    head_effect = None
+    if reason == "head_rejected":
+        head_effect = requests.RequestException("405 Method Not Allowed")
+    elif reason == "no_range_support":
+        mock_head.headers = {"content-length": str(256 << 20), "accept-ranges": "none"}
+    elif reason == "small_file":
+        mock_head.headers = {"content-length": str(len(payload)), "accept-ranges": "bytes"}
+    else:  # range_ignored: ranges advertised, but the Range GET gets a 200
+        mock_head.headers = {"content-length": str(256 << 20), "accept-ranges": "bytes"}
+
+    plain_response = MagicMock()
+    plain_response.headers = {"content-length": str(len(payload))}
+    plain_response.raw.read.side_effect = io.BytesIO(payload).read
+    range_response = MagicMock(status_code=200)
+
+    def fake_get(url, **kwargs):
+        # Range probes carry a headers= kwarg; the plain stream does not
+        return range_response if "headers" in kwargs else plain_response
+
+    downloader = Downloader()
+    with patch.object(downloader.session, "head", side_effect=head_effect, return_value=mock_head):
+        with patch.object(downloader.session, "get", side_effect=fake_get):
+            downloader.download_file("https://example.com/model.gguf", str(dest))
 
+    assert dest.read_bytes() == payload
+    assert dest.with_suffix(".gguf.confirmed").exists()
 
-@patch("neurobik.downloader.subprocess.run")
-def test_pull_oci_with_containerfile(mock_subprocess):
+
+@pytest.fixture(scope="module")
+def containerfile(tmp_path_factory):
+    """Module-wide Containerfile - the content is identical for every build
+    test, so write it once instead of mkdir+write+rmtree per parametrized
+    case. Returns (containerfile path, context directory)."""
+    context = tmp_path_factory.mktemp("ctx")
+    cf = context / "Containerfile.test"
+    cf.write_text("FROM ubuntu\n")
+    return str(cf), str(context)
+
+
+def test_pull_oci_with_containerfile(mock_subprocess, downloader, containerfile, tmp_path):
     """
     Test OCI container build with custom containerfile and build arguments.
 
@@ -233,39 +291,25 @@ def test_pull_oci_with_containerfile(mock_subprocess):
     - Test marker file creation
     """
 
-    from unittest.mock import MagicMock
-
-    # Setup
-    mock_subprocess.return_value = MagicMock(returncode=0)
-
-    downloader = Downloader()
     image = "test-image:latest"
+    cf_path, context = containerfile
+    confirmation_path = tmp_path / "test-confirmation"
 
-    # Create temporary directory for containerfile
-    with tempfile.TemporaryDirectory() as temp_dir:
-        containerfile = os.path.join(temp_dir, "Containerfile.test")
-        context = temp_dir
-        confirmation_file = os.path.join(temp_dir, "test-confirmation")
-
-        # Create temporary containerfile
-        with open(containerfile, 'w', encoding='utf-8') as f:
-            f.write("FROM ubuntu\n")
-
-        # Test with build_args
-        build_args = ["ARG1=value1", "ARG2=value2"]
-        downloader.pull_oci(image, confirmation_file, containerfile, build_args)
+    # Test with build_args
+    build_args = ["ARG1=value1", "ARG2=value2"]
+    downloader.pull_oci(image, str(confirmation_path), cf_path, build_args)
 
-        # Verify subprocess.run was called with correct command
-        expected_cmd = [
-            "podman", "build", "-t", image,
-            "--build-arg", "ARG1=value1",
-            "--build-arg", "ARG2=value2",
-            "-f", containerfile, context
-        ]
-        mock_subprocess.assert_called_once_with(expected_cmd, check=True)
+    # Verify subprocess.run was called with correct command
+    expected_cmd = [
+        "podman", "build", "-t", image,
+        "--build-arg", "ARG1=value1",
+        "--build-arg", "ARG2=value2",
+        "-f", cf_path, context
+    ]
+    mock_subprocess.assert_called_once_with(expected_cmd, check=True)
 
-        # Verify confirmation file was created
-        assert os.path.exists(confirmation_file)
+    # Verify confirmation file was created
+    assert confirmation_path.exists()
 
 
 @pytest.mark.parametrize("build_args,expected_build_args", [
@@ -278,8 +322,7 @@ def test_pull_oci_with_containerfile(mock_subprocess):
     (["ARG1=value1", "ARG2=value2"], ["--build-arg", "ARG1=value1", "--build-arg", "ARG2=value2"]),
     (["ROCM_INDEX_URL=https://example.com"], ["--build-arg", "ROCM_INDEX_URL=https://example.com"]),
 ])
-@patch("neurobik.downloader.subprocess.run")
-def test_pull_oci_build_args(mock_subprocess, build_args, expected_build_args):
+def test_pull_oci_build_args(mock_subprocess, build_args, expected_build_args, downloader, containerfile, tmp_path):
     """
     Test OCI container build with various build argument configurations.
 
@@ -305,35 +348,21 @@ def test_pull_oci_build_args(mock_subprocess, build_args, expected_build_args):
     - Verify conditional argument inclusion
     - Test array/list processing for command construction
     """
-    from unittest.mock import MagicMock
-
-    # Setup
-    mock_subprocess.return_value = MagicMock(returncode=0)
-
-    downloader = Downloader()
     image = "test-image:latest"
+    cf_path, context = containerfile
+    confirmation_path = tmp_path / "test-confirmation"
 
-    # Create temporary directory for containerfile
-    with tempfile.TemporaryDirectory() as temp_dir:
-        containerfile = os.path.join(temp_dir, "Containerfile.test")
-        context = temp_dir
-        confirmation_file = os.path.join(temp_dir, "test-confirmation")
-
-        # Create temporary containerfile
-        with open(containerfile, 'w', encoding='utf-8') as f:
-            f.write("FROM ubuntu\n")
+    downloader.pull_oci(image, str(confirmation_path), cf_path, build_args)
 
-        downloader.pull_oci(image, confirmation_file, containerfile, build_args)
+    # Build expected command
+    expected_cmd = ["podman", "build", "-t", image]
+    expected_cmd.extend(expected_build_args)
+    expected_cmd.extend(["-f", cf_path, context])
 
-        # Build expected command
-        expected_cmd = ["podman", "build", "-t", image]
-        expected_cmd.extend(expected_build_args)
-        expected_cmd.extend(["-f", containerfile, context])
+    mock_subprocess.assert_called_once_with(expected_cmd, check=True)
 
-        mock_subprocess.assert_called_once_with(expected_cmd, check=True)
-
-        # Verify confirmation file was created
-        assert os.path.exists(confirmation_file)
+    # Verify confirmation file was created
+    assert confirmation_path.exists()
 
 
 def test_create_default_symlink(tmp_path):
@@ -363,6 +392,25 @@ def test_create_default_symlink(tmp_path):
     - Validate symlink target resolution
     - Test with nested directory structures
     """
+    models_dir = tmp_path / "models"
+    subdir = models_dir / "llama"
+    subdir.mkdir(parents=True)
+    first = subdir / "a.gguf"
+    first.touch()
+
+    Downloader.create_default_symlink(str(models_dir), str(first))
+
+    link = models_dir / "default-model.gguf"
+    assert link.is_symlink()
+    # The link stores a relative path, so moving the tree keeps it valid
+    assert link.readlink() == Path("llama/a.gguf")
+    assert link.resolve() == first
+
+    # Updating to a new target replaces the existing link
+    second = subdir / "b.gguf"
+    second.touch()
+    Downloader.create_default_symlink(str(models_dir), str(second))
+    assert link.readlink() == Path("llama/b.gguf")
 
 
 def test_create_default_symlink_failure(tmp_path, monkeypatch):
@@ -378,8 +426,7 @@ def test_create_default_symlink_failure(tmp_path, monkeypatch):
     6. Verify new symlink is not created
 
     Key validations:
-    - Existing symlinks detected with os.path.lexists
-    - os.unlink attempted on existing symlinks
+    - os.unlink attempted on existing symlinks (EAFP, no lexists probe)
     - OSError from unlink caught and re-raised as RuntimeError
     - Descriptive error message includes symlink path
     - Operation fails atomically (no partial changes)
@@ -391,3 +438,17 @@ def test_create_default_symlink_failure(tmp_path, monkeypatch):
     - Test atomic operations (all or nothing)
     - Validate error recovery scenarios
     """
+    target = tmp_path / "a.gguf"
+    target.touch()
+    link = tmp_path / "default-model.gguf"
+    link.symlink_to("a.gguf")
+
+    def deny(path):
+        raise PermissionError(f"denied: {path}")
+
+    monkeypatch.setattr(os, "unlink", deny)
+    with pytest.raises(RuntimeError, match="Failed to remove existing symlink"):
+        Downloader.create_default_symlink(str(tmp_path), str(target))
+
+    # The existing link survives untouched
+    assert link.readlink() == Path("a.gguf")
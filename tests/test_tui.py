@@ -31,24 +31,27 @@ Dependencies for replication:
 
 # pylint: disable=import-outside-toplevel,redefined-outer-name,unused-argument,wrong-import-order
 
-from unittest.mock import patch
+import sys
 
 import pytest
+import questionary
 
 from neurobik.tui import NeurobikTUI
 
 
-def test_tui_run():
+def test_tui_run(mocker, monkeypatch):
     """
     Test TUI item selection and result parsing.
 
     Replication steps (Python/pytest):
     1. Create list of items with name and type fields
     2. Initialize NeurobikTUI with item list
-    3. Mock questionary.checkbox to return predefined selection
-    4. Call tui.run() and capture result
-    5. Assert result matches expected parsed selection
-    6. Verify checkbox was called with correct formatted choices
+    3. Fake a TTY so run() doesn't take the non-interactive shortcut
+    4. Patch questionary.checkbox via mocker.patch.object (direct
+       attribute swap - no string-target import resolution per call)
+    5. Call tui.run() and capture result
+    6. Assert result matches expected parsed selection
+    7. Verify checkbox was called with correct formatted choices
 
     Key validations:
     - Items formatted as "type: name" for display
@@ -63,3 +66,21 @@ def test_tui_run():
     - Test with different item types and counts
     - Ensure UI state isolation between tests
     """
+    items = [
+        {"name": "model1", "type": "model"},
+        {"name": "test-image:latest", "type": "oci"},
+    ]
+    tui = NeurobikTUI(items)
+
+    monkeypatch.delenv("NEUROBIK_YES", raising=False)
+    mocker.patch.object(sys, "stdin")  # MagicMock isatty() is truthy
+    mocker.patch.object(sys, "stdout")
+    mock_checkbox = mocker.patch.object(questionary, "checkbox")
+    mock_checkbox.return_value.ask.return_value = ["model: model1"]
+
+    result = tui.run()
+
+    assert result == [items[0]]
+    mock_checkbox.assert_called_once_with(
+        "Select items to download:", ["model: model1", "oci: test-image:latest"]
+    )
@@ -31,27 +31,30 @@ Dependencies for replication:
 
 # pylint: disable=import-outside-toplevel,redefined-outer-name,unused-argument,wrong-import-order
 
+import hashlib
 import os
-import tempfile
 
 import pytest
 
 from neurobik.utils import create_confirmation_file, verify_checksum
 
 
-def test_verify_checksum():
+@pytest.mark.parametrize("size", [1, 65536, pytest.param(1 << 20, marks=pytest.mark.slow)])
+def test_verify_checksum(size, tmp_path):
     """
     Test SHA256 checksum verification for file integrity.
 
     Replication steps (Python/pytest):
-    1. Create temporary file with known content
-    2. Compute expected SHA256 hash of content
+    1. Write a random payload of the parametrized size under tmp_path
+    2. Compute expected SHA256 with hashlib.file_digest, so the
+       expectation uses the stdlib's streaming path rather than a
+       hand-rolled chunk loop
     3. Call verify_checksum() with file path and expected hash
     4. Assert function returns True for matching checksums
-    5. Clean up temporary file
+    5. Assert function returns False for a wrong hash
 
     Key validations:
-    - File reading in chunks (streaming)
+    - File reading in chunks (streaming) across 1B / 64KiB / 1MiB sizes
     - SHA256 hash computation accuracy
     - Hexadecimal string comparison
     - Memory efficiency for large files
@@ -64,6 +67,14 @@ def test_verify_checksum():
     - Test with various file sizes
     - Ensure constant memory usage
     """
+    blob = tmp_path / "blob"
+    blob.write_bytes(os.urandom(size))
+
+    with open(blob, "rb") as fh:
+        expected = hashlib.file_digest(fh, "sha256").hexdigest()
+
+    assert verify_checksum(str(blob), expected)
+    assert not verify_checksum(str(blob), "0" * 64)
 
 
 def test_create_confirmation_file():